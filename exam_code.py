@@ -1,92 +1,410 @@
-import jieba
-import jieba.posseg as pseg
+import os
+import mmap
+import atexit
+import threading
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+try:
+    # 优先使用C扩展加速的jieba_fast，接口与jieba一致
+    import jieba_fast as jieba
+    import jieba_fast.posseg as pseg
+except ImportError:
+    import jieba
+    import jieba.posseg as pseg
 from collections import Counter
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
+from sys import intern
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import ImageTk, Image
+
+# matplotlib、wordcloud、PIL 导入开销大，改为在用到的函数内延迟导入；
+# 预先指定Agg后端，首次导入matplotlib时不再探测GUI后端
+os.environ.setdefault('MPLBACKEND', 'Agg')
 
 
 # ==================== NLP核心处理模块 ====================
+def load_stopwords(stopwords_path='stopwords.txt'):
+    """读取停用词表"""
+    if not os.path.exists(stopwords_path):
+        return frozenset()
+    with open(stopwords_path, encoding='utf-8') as f:
+        return frozenset(f.read().split())
+
+
+# jieba会把构建好的前缀词典序列化缓存，默认放在系统临时目录，容易被清理；
+# 改为程序目录下按jieba版本命名的文件，词典比缓存新时jieba会自动重建
+jieba.dt.tmp_dir = os.path.dirname(os.path.abspath(__file__))
+jieba.dt.cache_file = f"jieba_{jieba.__version__}.cache"
+
+# 文本文件统一按UTF-8严格解码，编码不符时报错而不是静默丢弃字节
+TEXT_ENCODING = 'utf-8'
+
+# 停用词表在模块加载时读取一次，供各次词频统计共享
+_STOPWORDS = load_stopwords()
+# 已加载过的用户词典：路径 -> 加载时的修改时间，文件未变化时不重复加载
+_USER_DICTS_LOADED = {}
+# 超过该长度（字符数）的文本启用jieba多进程并行分词
+PARALLEL_THRESHOLD = 1 << 20
+_parallel_enabled = False
+# 超过该大小（字节）的文件用进程池分块统计词频。实测串行分词约0.9MB/s，
+# 而每个spawn子进程启动并加载词典约1.7s，文件小于几MB时进程池得不偿失
+POOL_THRESHOLD = 4 << 20
+_COUNT_POOL = None
+
+
 def load_text(filepath):
-    """读取文本文件"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return f.read()
+    """读取文本文件，通过内存映射直接解码，省去中间的bytes副本"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, TEXT_ENCODING)
+
+
+def iter_text(filepath, chunksize=1 << 20):
+    """按约 chunksize 字节分块读取大文件，切分点优先落在空行，其次落在行尾"""
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = min(start + chunksize, size)
+                if end < size:
+                    cut = mm.rfind(b'\n\n', start, end)
+                    if cut < 0:
+                        cut = mm.rfind(b'\n', start, end)
+                    if cut < 0:
+                        # 块内没有换行时延伸到下一个换行，保证不截断UTF-8字符
+                        cut = mm.find(b'\n', end)
+                    end = size if cut < 0 else cut + 1
+                yield str(mm[start:end], TEXT_ENCODING)
+                start = end
+
+
+def load_user_dict(dict_path):
+    """加载用户词典，同一文件未修改时只加载一次"""
+    # 先写回该词典在内存中的改动，避免读到旧文件
+    cache = _USER_DICT_CACHES.get(dict_path)
+    if cache is not None:
+        cache.flush()
+    mtime = os.path.getmtime(dict_path)
+    if _USER_DICTS_LOADED.get(dict_path) != mtime:
+        jieba.load_userdict(dict_path)
+        _USER_DICTS_LOADED[dict_path] = mtime
+        _reset_parallel()
+        _reset_count_pool()
+
+
+def _reset_parallel():
+    """关闭jieba并行模式，下次处理大文本时用已加载新词典的状态重新开启"""
+    global _parallel_enabled
+    if _parallel_enabled:
+        jieba.disable_parallel()
+        _parallel_enabled = False
+
+
+def _maybe_enable_parallel(text):
+    """大文本开启并行分词（仅首次生效）
+
+    并行模式按行切分文本交给子进程处理，跨行的HMM新词识别结果
+    可能与串行模式略有差异。子进程看不到之后加载的用户词典，
+    因此 load_user_dict 会关闭并行模式，等下次需要时重新创建进程池。
+    Windows 下jieba不支持并行模式，此时保持串行。
+    """
+    global _parallel_enabled
+    if _parallel_enabled or len(text) < PARALLEL_THRESHOLD:
+        return
+    try:
+        jieba.enable_parallel(os.cpu_count())
+    except NotImplementedError:
+        pass
+    _parallel_enabled = True
 
 
 def tokenize(text, user_dict=None):
-    """分词功能"""
+    """分词功能，返回分词结果的生成器"""
     if user_dict:
-        jieba.load_userdict(user_dict)
-    return list(jieba.cut(text))
-
-
-def get_word_freq(tokens, stopwords_path='stopwords.txt'):
-    """词频统计"""
-    try:
-        stopwords = set(open(stopwords_path, encoding='utf-8').read().split())
-    except FileNotFoundError:
-        stopwords = set()
-    return Counter([w for w in tokens if w not in stopwords and len(w) > 1])
+        load_user_dict(user_dict)
+    _maybe_enable_parallel(text)
+    return jieba.cut(text)
+
+
+def iter_paragraphs(filepath):
+    """按空行切分文本文件，逐段产出"""
+    lines = []
+    with open(filepath, 'r', encoding=TEXT_ENCODING) as f:
+        for line in f:
+            if line.strip():
+                lines.append(line)
+            elif lines:
+                yield ''.join(lines)
+                lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+def iter_chunks(filepath, n_chunks):
+    """在段落边界处把文件切成大致均等的 n_chunks 块"""
+    return iter_text(filepath, os.path.getsize(filepath) // n_chunks + 1)
+
+
+def _drop_filtered(counter, stopwords):
+    """从计数结果中剔除单字词和停用词
+
+    逐词计数由Counter的C实现完成，这里只在去重后的词表上过滤一次，
+    开销与词表大小而不是文本长度成正比。
+    """
+    if stopwords:
+        dropped = [w for w in counter if len(w) <= 1 or w in stopwords]
+    else:
+        # 没有停用词表时只需检查词长，省去逐词的集合查找
+        dropped = [w for w in counter if len(w) <= 1]
+    for w in dropped:
+        del counter[w]
+    return counter
+
+
+def _init_count_worker(user_dicts):
+    """词频统计子进程初始化：每个进程只加载一次词典"""
+    jieba.initialize()
+    for dict_path in user_dicts:
+        load_user_dict(dict_path)
+
+
+def _count_chunk(text, stopwords):
+    """统计单个文本块的词频（在子进程中执行）"""
+    return _drop_filtered(Counter(jieba.cut(text)), stopwords)
+
+
+def _get_count_pool():
+    """词频统计进程池，首次使用时创建，之后各次统计复用"""
+    global _COUNT_POOL
+    if _COUNT_POOL is None:
+        # 使用spawn启动干净的子进程，避免继承jieba并行模式的进程池
+        _COUNT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                          mp_context=multiprocessing.get_context('spawn'),
+                                          initializer=_init_count_worker,
+                                          initargs=(tuple(_USER_DICTS_LOADED),))
+    return _COUNT_POOL
+
+
+def _reset_count_pool():
+    """用户词典变化后关闭进程池，下次统计时按新词典重新创建"""
+    global _COUNT_POOL
+    if _COUNT_POOL is not None:
+        _COUNT_POOL.shutdown(wait=False)
+        _COUNT_POOL = None
+
+
+def _parallel_word_freq(filepath, stopwords):
+    """多进程分块统计词频后在主进程合并"""
+    pool = _get_count_pool()
+    total = Counter()
+    for counter in pool.map(_count_chunk, iter_chunks(filepath, os.cpu_count()), repeat(stopwords)):
+        total.update(counter)
+    return total
+
+
+def get_word_freq(tokens, stopwords=None):
+    """词频统计，未指定 stopwords 时使用模块级停用词表"""
+    if stopwords is None:
+        stopwords = _STOPWORDS
+    return _drop_filtered(Counter(tokens), stopwords)
+
+
+def get_word_freq_from_file(filepath, stopwords=None):
+    """直接对文本文件统计词频
+
+    按段落分词并累加计数，内存占用不随文件大小增长；大文件则分块交给多个进程并行统计。
+    """
+    if stopwords is None:
+        stopwords = _STOPWORDS
+    if (os.cpu_count() or 1) > 1 and os.path.getsize(filepath) >= POOL_THRESHOLD:
+        return _parallel_word_freq(filepath, stopwords)
+    counter = Counter()
+    for paragraph in iter_paragraphs(filepath):
+        counter.update(jieba.cut(paragraph))
+    return _drop_filtered(counter, stopwords)
 
 
 def pos_analysis(text, save_path='pos_result.txt'):
     """词性标注并保存"""
-    words = pseg.cut(text)
-    result = [f"{word} {flag}" for word, flag in words]
-    with open(save_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(result))
+    _maybe_enable_parallel(text)
+    return save_pos_result(pseg.cut(text), save_path)
+
+
+def save_pos_result(pos_pairs, save_path='pos_result.txt'):
+    """逐条写入词性标注结果，返回 (词, 词性) 元组列表
+
+    结果会被缓存复用，词和词性都做驻留，重复出现的字符串只保留一份。
+    """
+    result = []
+    with open(save_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for word, flag in pos_pairs:
+            f.write(word)
+            f.write(' ')
+            f.write(flag)
+            f.write('\n')
+            result.append((intern(word), intern(flag)))
     return result
 
 
+def pos_tag(text):
+    """词性标注，返回 (词, 词性) 元组列表，不写文件"""
+    _maybe_enable_parallel(text)
+    return [(intern(word), intern(flag)) for word, flag in pseg.cut(text)]
+
+
+def _file_signature(filepath):
+    """文件缓存键：(路径, 修改时间, 大小)"""
+    st = os.stat(filepath)
+    return filepath, st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_word_freq(filepath, mtime, size):
+    """按文件签名缓存的词频统计，文件未变化时直接返回上次结果"""
+    return get_word_freq_from_file(filepath)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_pos(filepath, mtime, size):
+    """按文件签名缓存的词性标注结果，只缓存 (词, 词性) 元组，保存文件由调用方负责"""
+    return tuple(pos_tag(load_text(filepath)))
+
+
+def clear_analysis_cache():
+    """词典变化后分词结果随之变化，需清空缓存"""
+    _cached_word_freq.cache_clear()
+    _cached_pos.cache_clear()
+
+
 def extract_entities(pos_result, entity_tags):
-    """提取特定实体"""
-    return [(word.split()[0], word.split()[1])
-            for word in pos_result
-            if word.split()[1] in entity_tags]
+    """提取特定实体，pos_result 为 (词, 词性) 元组序列"""
+    tags = frozenset(entity_tags)
+    return [(word, flag) for word, flag in pos_result if flag in tags]
+
 
+# 词云对象复用，避免每次重新加载字体
+_WORDCLOUD = None
+WORDCLOUD_MAX_WORDS = 200
 
-def generate_wordcloud(text, save_path='wordcloud.png'):
-    """生成词云"""
-    wc = WordCloud(font_path='msyh.ttc', width=800, height=600)
-    wc.generate(text)
-    wc.to_file(save_path)
+
+def generate_wordcloud(word_freq, save_path='wordcloud.png'):
+    """根据词频 Counter 生成词云，无需再对文本重新分词"""
+    global _WORDCLOUD
+    if _WORDCLOUD is None:
+        from wordcloud import WordCloud
+        _WORDCLOUD = WordCloud(font_path='msyh.ttc', width=800, height=600,
+                               max_words=WORDCLOUD_MAX_WORDS)
+    _WORDCLOUD.generate_from_frequencies(dict(word_freq.most_common(WORDCLOUD_MAX_WORDS)))
+    _WORDCLOUD.to_file(save_path)
     return save_path
 
 
-def plot_freq_chart(counter, top_n=10, chart_type='bar', save_path='chart.png'):
-    """生成频率图表"""
-    # 设置中文字体为黑体，解决中文标签显示乱码问题
-    plt.rcParams['font.sans-serif'] = ['SimHei']
-    # 解决坐标轴负号显示异常问题
-    plt.rcParams['axes.unicode_minus'] = False
-    plt.switch_backend('Agg')  # 解决GUI中的线程问题
-    items = counter.most_common(top_n)
+# 图表复用同一个Figure/Axes，避免每次重新创建
+_FIG, _AX = None, None
+
+
+def _get_chart_axes():
+    """首次调用时创建图表，之后清空坐标轴复用"""
+    global _FIG, _AX
+    if _FIG is None:
+        import matplotlib
+        from matplotlib.figure import Figure
+        # 设置中文字体为黑体，解决中文标签显示乱码问题
+        matplotlib.rcParams['font.sans-serif'] = ['SimHei']
+        # 解决坐标轴负号显示异常问题
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        # 直接使用Figure而不经过pyplot，不依赖GUI后端，也无需close
+        _FIG = Figure(figsize=(12, 6))
+        _AX = _FIG.add_subplot(111)
+    else:
+        _AX.cla()
+    return _FIG, _AX
+
+
+def plot_freq_chart(counter, top_n=10, chart_type='bar', save_path='chart.png', top_words=None):
+    """生成频率图表，top_words 为已算好的 most_common 结果且条数足够时直接复用"""
+    if top_words is not None and len(top_words) >= top_n:
+        items = top_words[:top_n]
+    else:
+        items = counter.most_common(top_n)
     words, counts = zip(*items)
 
-    plt.figure(figsize=(12, 6))
+    fig, ax = _get_chart_axes()
     if chart_type == 'bar':
-        plt.bar(words, counts)
+        ax.bar(words, counts)
     elif chart_type == 'pie':
-        plt.pie(counts, labels=words, autopct='%1.1f%%')
+        ax.pie(counts, labels=words, autopct='%1.1f%%')
 
-    plt.title('词频分布图')
-    plt.savefig(save_path)
-    plt.close()
+    ax.set_title('词频分布图')
+    fig.savefig(save_path)
     return save_path
 
 
+class UserDictCache:
+    """用户词典的内存缓存，增删只改内存，flush 时一次性写回文件"""
+
+    def __init__(self, dict_path):
+        self.dict_path = dict_path
+        self.words = None  # 首次使用时才读取文件；用dict保持词条原有顺序
+        self.dirty = False
+
+    def _load(self):
+        if self.words is None:
+            self.words = {}
+            if os.path.exists(self.dict_path):
+                with open(self.dict_path, encoding='utf-8') as f:
+                    self.words = dict.fromkeys(line.strip() for line in f if line.strip())
+        return self.words
+
+    def add(self, word):
+        words = self._load()
+        if word not in words:
+            words[word] = None
+            self.dirty = True
+
+    def remove(self, word):
+        words = self._load()
+        if word in words:
+            del words[word]
+            self.dirty = True
+
+    def flush(self):
+        """有改动时写回词典文件"""
+        if not self.dirty:
+            return
+        with open(self.dict_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.words))
+        self.dirty = False
+
+
+_USER_DICT_CACHES = {}
+
+
 def manage_custom_dict(word, action='add', dict_path='user_dict.txt'):
-    """管理用户词典"""
+    """管理用户词典，改动在 flush_custom_dicts 时写回文件"""
+    cache = _USER_DICT_CACHES.get(dict_path)
+    if cache is None:
+        cache = _USER_DICT_CACHES[dict_path] = UserDictCache(dict_path)
     if action == 'add':
-        with open(dict_path, 'a', encoding='utf-8') as f:
-            f.write(f"\n{word}")
+        cache.add(word)
     elif action == 'remove':
-        lines = [line for line in open(dict_path, encoding='utf-8')
-                 if line.strip() != word]
-        with open(dict_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        cache.remove(word)
+
+
+def flush_custom_dicts():
+    """把所有用户词典的改动写回文件"""
+    for cache in _USER_DICT_CACHES.values():
+        cache.flush()
+
+
+# 非GUI调用或程序异常退出时也要写回改动
+atexit.register(flush_custom_dicts)
 
 
 # ==================== GUI界面模块 ====================
@@ -98,8 +416,22 @@ class NLPApp:
 
         # 初始化属性
         self.raw_text = ""
+        self.text_path = None
         self.tokens = []
         self.word_freq = None
+        self.top_words = None  # 词频Top 10缓存，图表直接复用
+        self.pos_result = None  # 词性标注结果缓存，供实体抽取复用
+        self.buttons = []  # 后台任务执行期间需要禁用的按钮
+
+        # 耗时分析放到单个工作线程执行，避免阻塞Tk主循环
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._closed = False  # 窗口关闭后后台任务不再回调界面
+
+        # 关闭窗口时写回用户词典
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # 后台初始化jieba词典，避免阻塞界面绘制
+        threading.Thread(target=jieba.initialize, daemon=True).start()
 
         # 界面布局
         self.create_file_frame()
@@ -114,18 +446,18 @@ class NLPApp:
 
         self.filepath = tk.StringVar()
         ttk.Entry(frame, textvariable=self.filepath, width=50).grid(row=0, column=0, padx=5)
-        ttk.Button(frame, text="选择文件", command=self.load_file).grid(row=0, column=1)
-        ttk.Button(frame, text="加载自定义词典", command=self.load_dict).grid(row=0, column=2)
+        self.add_button(frame, text="选择文件", command=self.load_file).grid(row=0, column=1)
+        self.add_button(frame, text="加载自定义词典", command=self.load_dict).grid(row=0, column=2)
 
     def create_analysis_frame(self):
         """分析功能区域"""
         frame = ttk.LabelFrame(self.master, text="分析功能")
         frame.pack(fill='x', padx=10, pady=5)
 
-        ttk.Button(frame, text="执行分词", command=self.run_tokenize).grid(row=0, column=0, padx=5)
-        ttk.Button(frame, text="词频统计", command=self.run_word_freq).grid(row=0, column=1)
-        ttk.Button(frame, text="词性分析", command=self.run_pos_analysis).grid(row=0, column=2)
-        ttk.Button(frame, text="实体抽取", command=self.run_entity_extract).grid(row=0, column=3)
+        self.add_button(frame, text="执行分词", command=self.run_tokenize).grid(row=0, column=0, padx=5)
+        self.add_button(frame, text="词频统计", command=self.run_word_freq).grid(row=0, column=1)
+        self.add_button(frame, text="词性分析", command=self.run_pos_analysis).grid(row=0, column=2)
+        self.add_button(frame, text="实体抽取", command=self.run_entity_extract).grid(row=0, column=3)
 
     def create_visual_frame(self):
         """可视化区域"""
@@ -140,11 +472,11 @@ class NLPApp:
 
         control_frame = ttk.Frame(frame)
         control_frame.pack(side='right', padx=10)
-        ttk.Button(control_frame, text="生成词云", command=self.show_wordcloud).pack(pady=5)
-        ttk.Button(control_frame, text="柱状图",
-                   command=lambda: self.show_chart('bar')).pack(pady=5)
-        ttk.Button(control_frame, text="饼状图",
-                   command=lambda: self.show_chart('pie')).pack(pady=5)
+        self.add_button(control_frame, text="生成词云", command=self.show_wordcloud).pack(pady=5)
+        self.add_button(control_frame, text="柱状图",
+                        command=lambda: self.show_chart('bar')).pack(pady=5)
+        self.add_button(control_frame, text="饼状图",
+                        command=lambda: self.show_chart('pie')).pack(pady=5)
 
     def create_output_frame(self):
         """结果显示区域"""
@@ -158,6 +490,54 @@ class NLPApp:
         self.result_text.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
+    def add_button(self, parent, **kwargs):
+        """创建按钮并登记，后台任务执行期间统一禁用"""
+        button = ttk.Button(parent, **kwargs)
+        self.buttons.append(button)
+        return button
+
+    def set_busy(self, busy):
+        """切换按钮可用状态，防止任务重复提交"""
+        for button in self.buttons:
+            button.state(['disabled' if busy else '!disabled'])
+
+    def run_async(self, task, on_success, error_msg):
+        """在工作线程执行 task，完成后回到Tk主线程调用 on_success(结果)"""
+        self.set_busy(True)
+        future = self._executor.submit(task)
+        future.add_done_callback(lambda f: self._schedule_result(f, on_success, error_msg))
+
+    def _schedule_result(self, future, on_success, error_msg):
+        """在工作线程中调用，把结果交回Tk主线程；窗口已关闭时直接丢弃"""
+        if self._closed:
+            return
+        try:
+            self.master.after(0, self._apply_result, future, on_success, error_msg)
+        except (RuntimeError, tk.TclError):
+            pass  # 检查之后窗口恰好被销毁
+
+    def _apply_result(self, future, on_success, error_msg):
+        """在主线程处理后台任务结果"""
+        if self._closed:
+            return
+        self.set_busy(False)
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("错误", f"{error_msg}：{str(e)}")
+            return
+        on_success(result)
+
+    def on_close(self):
+        """退出程序"""
+        self._closed = True
+        try:
+            flush_custom_dicts()
+        except Exception as e:
+            messagebox.showerror("错误", f"词典保存失败：{str(e)}")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
+
     # 核心功能方法
     def load_file(self):
         """加载文本文件"""
@@ -166,8 +546,14 @@ class NLPApp:
             self.filepath.set(path)
             try:
                 self.raw_text = load_text(path)
+                self.text_path = path
+                self.tokens = []
+                self.set_word_freq(None)
+                self.pos_result = None
                 self.result_text.delete(1.0, tk.END)
                 self.result_text.insert(tk.END, "文件加载成功！")
+            except UnicodeDecodeError:
+                messagebox.showerror("错误", "文件读取失败：文件不是UTF-8编码，请转换编码后重试")
             except Exception as e:
                 messagebox.showerror("错误", f"文件读取失败：{str(e)}")
 
@@ -176,7 +562,12 @@ class NLPApp:
         path = filedialog.askopenfilename(filetypes=[("Dict files", "*.txt")])
         if path:
             try:
-                jieba.load_userdict(path)
+                load_user_dict(path)
+                clear_analysis_cache()
+                # 已有的分词、词频和词性结果基于旧词典，需要重新计算
+                self.tokens = []
+                self.set_word_freq(None)
+                self.pos_result = None
                 messagebox.showinfo("提示", "自定义词典加载成功！")
             except Exception as e:
                 messagebox.showerror("错误", f"词典加载失败：{str(e)}")
@@ -186,80 +577,121 @@ class NLPApp:
         if not hasattr(self, 'raw_text') or not self.raw_text:
             messagebox.showerror("错误", "请先选择文件！")
             return
-        try:
-            self.tokens = tokenize(self.raw_text)
+        raw_text = self.raw_text
+
+        def done(tokens):
+            self.tokens = tokens
             self.result_text.delete(1.0, tk.END)
             self.result_text.insert(tk.END, "分词结果：\n" + "/".join(self.tokens[:200]) + "...")
-        except Exception as e:
-            messagebox.showerror("错误", f"分词失败：{str(e)}")
+
+        # 分词结果需要物化为列表保存；驻留重复出现的词，相同的词共用一个字符串对象
+        self.run_async(lambda: list(map(intern, tokenize(raw_text))), done, "分词失败")
+
+    def set_word_freq(self, word_freq):
+        """更新词频结果，同时缓存Top 10，避免每次显示和画图重复计算"""
+        self.word_freq = word_freq
+        self.top_words = word_freq.most_common(10) if word_freq is not None else None
+
+    def word_freq_task(self):
+        """返回计算词频的任务：已分词时直接统计分词结果，否则按文件统计并缓存"""
+        tokens, text_path = self.tokens, self.text_path
+        if tokens:
+            return lambda: get_word_freq(tokens)
+        return lambda: _cached_word_freq(*_file_signature(text_path))
 
     def run_word_freq(self):
         """词频统计"""
-        if not self.tokens:
-            messagebox.showerror("错误", "请先执行分词！")
+        if not self.text_path:
+            messagebox.showerror("错误", "请先加载文件！")
             return
-        try:
-            self.word_freq = get_word_freq(self.tokens)
+        compute = self.word_freq_task()
+
+        def done(word_freq):
+            self.set_word_freq(word_freq)
             self.result_text.delete(1.0, tk.END)
-            top_words = self.word_freq.most_common(10)
             self.result_text.insert(tk.END, "词频统计结果（Top 10）：\n")
-            for word, count in top_words:
+            for word, count in self.top_words:
                 self.result_text.insert(tk.END, f"{word}: {count}\n")
-        except Exception as e:
-            messagebox.showerror("错误", f"词频统计失败：{str(e)}")
+
+        self.run_async(compute, done, "词频统计失败")
 
     def run_pos_analysis(self):
         """词性分析"""
-        if not self.raw_text:
+        if not self.text_path:
             messagebox.showerror("错误", "请先加载文件！")
             return
-        try:
-            pos_result = pos_analysis(self.raw_text)
+        text_path = self.text_path
+
+        def task():
+            pos_result = _cached_pos(*_file_signature(text_path))
+            # 命中缓存时也要重写结果文件，否则文件里可能是其他文本的结果
+            save_pos_result(pos_result)
+            return pos_result
+
+        def done(pos_result):
+            self.pos_result = pos_result
             self.result_text.delete(1.0, tk.END)
             self.result_text.insert(tk.END, "词性分析结果已保存到 pos_result.txt")
-        except Exception as e:
-            messagebox.showerror("错误", f"词性分析失败：{str(e)}")
+
+        self.run_async(task, done, "词性分析失败")
 
     def run_entity_extract(self):
         """实体抽取"""
         if not self.raw_text:
             messagebox.showerror("错误", "请先加载文件！")
             return
-        try:
-            pos_result = pseg.cut(self.raw_text)
-            entities = extract_entities([f"{w} {f}" for w, f in pos_result], ['nr', 'ns'])
+        raw_text, pos_result = self.raw_text, self.pos_result
+
+        def task():
+            result = pos_result
+            if result is None:
+                result = pos_tag(raw_text)
+            return result, extract_entities(result, ['nr', 'ns'])
+
+        def done(result):
+            self.pos_result, entities = result
             self.result_text.delete(1.0, tk.END)
             self.result_text.insert(tk.END, "抽取的实体：\n" + "\n".join([f"{w} ({t})" for w, t in entities]))
-        except Exception as e:
-            messagebox.showerror("错误", f"实体抽取失败：{str(e)}")
+
+        self.run_async(task, done, "实体抽取失败")
 
     def show_wordcloud(self):
         """显示词云"""
-        if not self.raw_text:
+        if not self.text_path:
             messagebox.showerror("错误", "请先加载文件！")
             return
-        try:
-            img_path = generate_wordcloud(" ".join(self.tokens))
+        word_freq, compute = self.word_freq, self.word_freq_task()
+
+        def task():
+            freq = word_freq if word_freq is not None else compute()
+            return freq, generate_wordcloud(freq)
+
+        def done(result):
+            word_freq, img_path = result
+            if word_freq is not self.word_freq:
+                self.set_word_freq(word_freq)
             self.display_image(img_path)
-        except Exception as e:
-            messagebox.showerror("错误", f"生成词云失败：{str(e)}")
+
+        self.run_async(task, done, "生成词云失败")
 
     def show_chart(self, chart_type):
         """显示图表"""
         if not self.word_freq:
             messagebox.showerror("错误", "请先进行词频统计！")
             return
-        try:
-            img_path = plot_freq_chart(self.word_freq, chart_type=chart_type)
-            self.display_image(img_path)
-        except Exception as e:
-            messagebox.showerror("错误", f"生成图表失败：{str(e)}")
+        word_freq, top_words = self.word_freq, self.top_words
+        self.run_async(lambda: plot_freq_chart(word_freq, chart_type=chart_type, top_words=top_words),
+                       self.display_image, "生成图表失败")
 
     def display_image(self, img_path):
         """显示图片"""
         try:
+            from PIL import ImageTk, Image
             img = Image.open(img_path)
-            img = img.resize((600, 400), Image.Resampling.LANCZOS)
+            # 界面预览用thumbnail原地缩放（保持宽高比），双线性插值足够清晰
+            img.thumbnail((600, 400), Image.Resampling.BILINEAR)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')  # 去掉alpha通道，减少PhotoImage的数据拷贝
             photo = ImageTk.PhotoImage(img)
             self.img_label.configure(image=photo)
             self.img_label.image = photo  # 保持引用